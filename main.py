@@ -1,14 +1,18 @@
+import time
+STARTUP_T0 = time.perf_counter()
+
 import customtkinter as ctk
 from tkinter import messagebox, simpledialog, filedialog
 import subprocess
 import os
-import time
 import shutil
 import shlex
+import re
 import threading
 import platform
-import mimetypes
 
+# The root window must inherit DnDWrapper, so tkinterdnd2 is imported here; loading
+# the tkdnd Tcl package (the slow part) is deferred until after first paint.
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     HAS_DND = True
@@ -17,6 +21,10 @@ except ImportError:
     HAS_DND = False
     class DnDWrapper(object): pass
 
+# Heavier modules (archive codecs, concurrent.futures, json, mimetypes) are
+# imported where they are used so they stay off the startup path.
+IMPORT_TIME = time.perf_counter() - STARTUP_T0
+
 # --- ToolTip Class ---
 class ToolTip(object):
     def __init__(self, widget, text='widget info'):
@@ -68,23 +76,735 @@ class ToolTip(object):
         if tw:
             tw.destroy()
 
+# --- SNOW Whitespace Decoder ---
+# ICE block cipher (used by SNOW for -p passphrases), ported from Matthew Kwan's reference C code.
+ICE_SMOD = [[333, 313, 505, 369], [379, 375, 319, 391],
+            [361, 445, 451, 397], [397, 425, 395, 505]]
+ICE_SXOR = [[0x83, 0x85, 0x9b, 0xcd], [0xcc, 0xa7, 0xad, 0x41],
+            [0x4b, 0x2e, 0xd4, 0x33], [0xea, 0xcb, 0x2e, 0x04]]
+ICE_PBOX = [0x00000001, 0x00000080, 0x00000400, 0x00002000,
+            0x00080000, 0x00200000, 0x01000000, 0x40000000,
+            0x00000008, 0x00000020, 0x00000100, 0x00004000,
+            0x00010000, 0x00800000, 0x04000000, 0x20000000,
+            0x00000004, 0x00000010, 0x00000200, 0x00008000,
+            0x00020000, 0x00400000, 0x08000000, 0x10000000,
+            0x00000002, 0x00000040, 0x00000800, 0x00001000,
+            0x00040000, 0x00100000, 0x02000000, 0x80000000]
+ICE_KEYROT = [0, 1, 2, 3, 2, 1, 3, 0, 1, 3, 2, 0, 3, 1, 0, 2]
+_ice_sbox = None
+
+def _gf_mult(a, b, m):
+    res = 0
+    while b:
+        if b & 1: res ^= a
+        a <<= 1
+        b >>= 1
+        if a >= 256: a ^= m
+    return res
+
+def _gf_exp7(b, m):
+    if b == 0: return 0
+    x = _gf_mult(b, b, m)
+    x = _gf_mult(b, x, m)
+    x = _gf_mult(x, x, m)
+    return _gf_mult(b, x, m)
+
+def _ice_perm32(x):
+    res = 0
+    i = 0
+    while x:
+        if x & 1: res |= ICE_PBOX[i]
+        i += 1
+        x >>= 1
+    return res
+
+def _ice_sboxes():
+    # Built once on first use and shared by every key (and every scan thread)
+    global _ice_sbox
+    if _ice_sbox is None:
+        sbox = [[0] * 1024 for _ in range(4)]
+        for i in range(1024):
+            col = (i >> 1) & 0xff
+            row = (i & 0x1) | ((i & 0x200) >> 8)
+            for n in range(4):
+                x = _gf_exp7(col ^ ICE_SXOR[n][row], ICE_SMOD[n][row]) << (24 - 8 * n)
+                sbox[n][i] = _ice_perm32(x)
+        _ice_sbox = sbox
+    return _ice_sbox
+
+class IceKey(object):
+    def __init__(self, level, key):
+        self.sbox = _ice_sboxes()
+        if level < 1:
+            self.size, self.rounds = 1, 8
+        else:
+            self.size, self.rounds = level, level * 16
+        self.sched = [[0, 0, 0] for _ in range(self.rounds)]
+
+        if self.rounds == 8:
+            kb = [0] * 4
+            for i in range(4):
+                kb[3 - i] = (key[i * 2] << 8) | key[i * 2 + 1]
+            self._sched_build(kb, 0, ICE_KEYROT[:8])
+            return
+
+        for i in range(self.size):
+            kb = [0] * 4
+            for j in range(4):
+                kb[3 - j] = (key[i * 8 + j * 2] << 8) | key[i * 8 + j * 2 + 1]
+            self._sched_build(kb, i * 8, ICE_KEYROT[:8])
+            self._sched_build(kb, self.rounds - 8 - i * 8, ICE_KEYROT[8:])
+
+    def _sched_build(self, kb, n, keyrot):
+        for i in range(8):
+            kr = keyrot[i]
+            sk = self.sched[n + i]
+            sk[0] = sk[1] = sk[2] = 0
+            for j in range(15):
+                for k in range(4):
+                    idx = (kr + k) & 3
+                    bit = kb[idx] & 1
+                    sk[j % 3] = (sk[j % 3] << 1) | bit
+                    kb[idx] = (kb[idx] >> 1) | ((bit ^ 1) << 15)
+
+    def _f(self, p, sk):
+        tl = ((p >> 16) & 0x3ff) | (((p >> 14) | (p << 18)) & 0xffc00)
+        tr = (p & 0x3ff) | ((p << 2) & 0xffc00)
+        al = sk[2] & (tl ^ tr)
+        ar = al ^ tr
+        al ^= tl
+        al ^= sk[0]
+        ar ^= sk[1]
+        s = self.sbox
+        return s[0][al >> 10] | s[1][al & 0x3ff] | s[2][ar >> 10] | s[3][ar & 0x3ff]
+
+    def encrypt(self, block):
+        l = int.from_bytes(block[:4], "big")
+        r = int.from_bytes(block[4:8], "big")
+        for i in range(0, self.rounds, 2):
+            l ^= self._f(r, self.sched[i])
+            r ^= self._f(l, self.sched[i + 1])
+        return r.to_bytes(4, "big") + l.to_bytes(4, "big")
+
+def snow_ice_key(password):
+    """Builds the ICE key and IV exactly like SNOW's password_set()"""
+    buf = bytearray(1024)
+    i = 0
+    # surrogateescape gives back the raw bytes of wordlist lines that are not UTF-8
+    for ch in password.encode("utf-8", "surrogateescape"):
+        c = ch & 0x7f
+        idx, bit = i // 8, i & 7
+        if bit == 0:
+            buf[idx] = (c << 1) & 0xff
+        elif bit == 1:
+            buf[idx] |= c
+        else:
+            buf[idx] |= c >> (bit - 1)
+            buf[idx + 1] = (c << (9 - bit)) & 0xff
+        i += 7
+        if i > 8184: break
+    key = IceKey((i + 63) // 64, buf)
+    return key, key.encrypt(bytes(buf[:8]))
+
+def snow_extract_bits(filepath, stop_flag=None):
+    """
+    Streams a text file line by line and returns the raw SNOW bitstream
+    (a bytearray of 0/1 values), or None when no start tab was found.
+    Raises ValueError on whitespace that cannot be a SNOW encoding.
+    """
+    bits = bytearray()
+    start_tab_found = False
+    with open(filepath, "rb") as f:
+        for line in f:
+            if stop_flag is not None and stop_flag.is_set(): break
+            line = line.rstrip(b"\r\n")
+            trailing = line[len(line.rstrip(b" \t")):]
+            if not trailing: continue
+
+            if not start_tab_found:
+                if trailing[0] != 0x09: continue
+                start_tab_found = True
+                trailing = trailing[1:]
+
+            spc = 0
+            for ch in trailing:
+                if ch == 0x20:
+                    spc += 1
+                    continue
+                if spc > 7:
+                    raise ValueError(f"Illegal encoding of {spc} spaces")
+                bits += bytes(((spc >> 2) & 1, (spc >> 1) & 1, spc & 1))
+                spc = 0
+            if spc:
+                if spc > 7:
+                    raise ValueError(f"Illegal encoding of {spc} spaces")
+                bits += bytes(((spc >> 2) & 1, (spc >> 1) & 1, spc & 1))
+    return bits if start_tab_found else None
+
+def snow_decrypt_bits(bits, password, stop_flag=None):
+    """Undoes SNOW's 1-bit CFB ICE encryption on an extracted bitstream. Returns None if stopped."""
+    key, iv = snow_ice_key(password)
+    iv = int.from_bytes(iv, "big")
+    out = bytearray(len(bits))
+    for i, bit in enumerate(bits):
+        if stop_flag is not None and i & 63 == 0 and stop_flag.is_set():
+            return None
+        ks = key.encrypt(iv.to_bytes(8, "big"))[0] >> 7
+        out[i] = bit ^ ks
+        iv = ((iv << 1) & 0xffffffffffffffff) | bit
+    return out
+
+def snow_bits_to_bytes(bits):
+    """Packs bits MSB-first; trailing residual bits are dropped like SNOW does"""
+    out = bytearray()
+    for i in range(0, len(bits) - 7, 8):
+        v = 0
+        for b in bits[i:i + 8]:
+            v = (v << 1) | b
+        out.append(v)
+    return bytes(out)
+
+# SNOW's Huffman table for -C, taken verbatim from huffcode.h in the SNOW source
+SNOW_HUFFCODE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "huffcode.h")
+_snow_huffcodes = None
+
+def snow_huffcodes():
+    """Returns SNOW's Huffman table as {code: byte}, or {} when huffcode.h is not available"""
+    global _snow_huffcodes
+    if _snow_huffcodes is None:
+        codes = []
+        try:
+            with open(SNOW_HUFFCODE_FILE, "r") as f:
+                codes = re.findall(r'"([01]+)"', f.read())
+        except OSError:
+            pass
+        if codes and len(codes) != 256:
+            print(f"Error loading {SNOW_HUFFCODE_FILE}: expected 256 codes, found {len(codes)}")
+            codes = []
+        _snow_huffcodes = {code: byte for byte, code in enumerate(codes)}
+    return _snow_huffcodes
+
+def snow_uncompress_bits(bits, huffcodes):
+    """Decodes SNOW's Huffman compression (-C) using a code -> byte table"""
+    out = bytearray()
+    code = ""
+    for b in bits:
+        code += "1" if b else "0"
+        value = huffcodes.get(code)
+        if value is not None:
+            out.append(value)
+            code = ""
+        elif len(code) >= 255:
+            return None
+    return bytes(out)
+
+def snow_printable_ratio(data):
+    if not data: return 0.0
+    good = sum(1 for b in data if 32 <= b < 127 or b in (9, 10, 13))
+    return good / len(data)
+
+def snow_decode_candidates(bits, passwords, stop_flag=None):
+    """
+    Tries each passphrase (None meaning unencrypted) against one extracted
+    bitstream, in both the plain and the compressed variant.
+    """
+    huffcodes = snow_huffcodes()
+    candidates = []
+    for pwd in passwords:
+        if stop_flag is not None and stop_flag.is_set(): break
+        plain_bits = snow_decrypt_bits(bits, pwd, stop_flag) if pwd else bits
+        if plain_bits is None: break
+        variants = [("plain", snow_bits_to_bytes(plain_bits))]
+        if huffcodes:
+            unpacked = snow_uncompress_bits(plain_bits, huffcodes)
+            if unpacked is not None:
+                variants.append(("compressed", unpacked))
+        for variant, data in variants:
+            if data:
+                candidates.append({"password": pwd, "variant": variant,
+                                   "score": snow_printable_ratio(data), "data": data})
+    return candidates
+
+def _snow_read(filepath, stop_flag=None):
+    result = {"file": filepath, "found": False, "bits": 0, "candidates": [], "error": None}
+    try:
+        bits = snow_extract_bits(filepath, stop_flag)
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+        return result, None
+    if bits:
+        result["found"] = True
+        result["bits"] = len(bits)
+    return result, bits or None
+
+def snow_scan_file(filepath, passwords=None, stop_flag=None):
+    """
+    Decodes one file. The whitespace is read once; every passphrase (plus no
+    passphrase) is then tried against that bitstream. Returns a result dict,
+    candidates sorted best first.
+    """
+    result, bits = _snow_read(filepath, stop_flag)
+    if bits:
+        passwords = [None] + [p for p in (passwords or []) if p]
+        result["candidates"] = snow_decode_candidates(bits, passwords, stop_flag)
+        result["candidates"].sort(key=lambda c: c["score"], reverse=True)
+    return result
+
+# Spawned workers re-import this module (about a second each), so the pool is only
+# worth starting when there are at least this many passphrase x file trials
+SNOW_POOL_MIN_TRIALS = 1000
+
+# Set in each pool worker by _snow_worker_init
+_snow_worker_stop = None
+_snow_worker_passwords = None
+
+def _snow_worker_init(stop_event, passwords):
+    global _snow_worker_stop, _snow_worker_passwords
+    _snow_worker_stop = stop_event
+    _snow_worker_passwords = passwords
+
+def _snow_worker_scan(filepath):
+    return snow_scan_file(filepath, _snow_worker_passwords, _snow_worker_stop)
+
+def snow_scan_files(paths, passwords=None, stop_flag=None, workers=None):
+    """
+    Scans many files, yielding one result per file as it completes. Without
+    passphrases a file is a single cheap pass, so everything runs in-process.
+    With enough passphrases every file is one pool job (read, extract and
+    decode in the worker), since pure-Python ICE would otherwise serialise on
+    the GIL.
+    """
+    passwords = [p for p in (passwords or []) if p]
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1 or len(passwords) * len(paths) < SNOW_POOL_MIN_TRIALS:
+        for path in paths:
+            if stop_flag is not None and stop_flag.is_set(): return
+            yield snow_scan_file(path, passwords, stop_flag)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    # spawn, never fork: the caller is a worker thread of a running Tk process.
+    # The passphrases go to each worker once, through the initializer.
+    ctx = multiprocessing.get_context("spawn")
+    stop_event = ctx.Event()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_snow_worker_init, initargs=(stop_event, passwords)) as pool:
+        pending = {pool.submit(_snow_worker_scan, path) for path in paths}
+        while pending:
+            done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            if stop_flag is not None and stop_flag.is_set():
+                stop_event.set()
+                for fut in pending:
+                    fut.cancel()
+                return
+            for fut in done:
+                yield fut.result()
+
+# --- Hash Identifier ---
+# (prefix, full-match pattern, candidates). Candidates are (name, hashcat mode) pairs; the
+# first is the suggestion, the rest are alternatives. Mode None means hashcat has no kernel.
+HASH_PREFIX_TABLE = [
+    ("$argon2id$", r"\$argon2id\$v=\d+\$m=\d+,t=\d+,p=\d+\$[A-Za-z0-9+/]+\$[A-Za-z0-9+/]+", [("Argon2id", 34000)]),
+    ("$argon2i$", r"\$argon2i\$v=\d+\$m=\d+,t=\d+,p=\d+\$[A-Za-z0-9+/]+\$[A-Za-z0-9+/]+", [("Argon2i", 34000)]),
+    ("$argon2d$", r"\$argon2d\$v=\d+\$m=\d+,t=\d+,p=\d+\$[A-Za-z0-9+/]+\$[A-Za-z0-9+/]+", [("Argon2d", 34000)]),
+    ("$krb5tgs$23$", r"\$krb5tgs\$23\$(?:\*[^*]*\*\$)?[0-9a-fA-F]{32}\$[0-9a-fA-F]{64,}",
+     [("Kerberos 5 TGS-REP etype 23", 13100)]),
+    ("$krb5tgs$17$", r"\$krb5tgs\$17\$[^$]+\$[^$]+\$(?:\*[^*]*\*\$)?[0-9a-fA-F]{24}\$[0-9a-fA-F]{64,}",
+     [("Kerberos 5 TGS-REP etype 17", 19600)]),
+    ("$krb5tgs$18$", r"\$krb5tgs\$18\$[^$]+\$[^$]+\$(?:\*[^*]*\*\$)?[0-9a-fA-F]{24}\$[0-9a-fA-F]{64,}",
+     [("Kerberos 5 TGS-REP etype 18", 19700)]),
+    ("$krb5asrep$23$", r"\$krb5asrep\$23\$[^:]+:[0-9a-fA-F]{32}\$[0-9a-fA-F]{64,}",
+     [("Kerberos 5 AS-REP etype 23", 18200)]),
+    ("$2", r"\$2[abxy]\$\d{2}\$[./0-9A-Za-z]{53}", [("bcrypt", 3200)]),
+    ("$apr1$", r"\$apr1\$[./0-9A-Za-z]{0,8}\$[./0-9A-Za-z]{22}", [("Apache APR1-MD5", 1600)]),
+    ("$1$", r"\$1\$[^$]{0,8}\$[./0-9A-Za-z]{22}", [("md5crypt", 500)]),
+    ("$5$", r"\$5\$(?:rounds=\d+\$)?[^$]{0,16}\$[./0-9A-Za-z]{43}", [("sha256crypt", 7400)]),
+    ("$6$", r"\$6\$(?:rounds=\d+\$)?[^$]{0,16}\$[./0-9A-Za-z]{86}", [("sha512crypt", 1800)]),
+    ("$y$", r"\$y\$[./0-9A-Za-z]+\$[./0-9A-Za-z]*\$[./0-9A-Za-z]{43}", [("yescrypt", None)]),
+    ("$P$", r"\$P\$[./0-9A-Za-z]{31}", [("phpass", 400)]),
+    ("$H$", r"\$H\$[./0-9A-Za-z]{31}", [("phpass", 400)]),
+    ("$office$*2013*", r"\$office\$\*2013\*\d+\*256\*16\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{64}",
+     [("MS Office 2013", 9600)]),
+    ("$office$*2010*", r"\$office\$\*2010\*\d+\*128\*16\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{64}",
+     [("MS Office 2010", 9500)]),
+    ("$office$*2007*", r"\$office\$\*2007\*20\*128\*16\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{32}\*[0-9a-fA-F]{40}",
+     [("MS Office 2007", 9400)]),
+    ("$pdf$1*2*", r"\$pdf\$1\*2\*40\*-?\d+\*[01]\*16\*[0-9a-fA-F]{32}\*32\*[0-9a-fA-F]{64}\*32\*[0-9a-fA-F]{64}",
+     [("PDF 1.1 - 1.3", 10400)]),
+    ("$pdf$2*3*", r"\$pdf\$2\*3\*128\*-?\d+\*[01]\*16\*[0-9a-fA-F]{32}\*32\*[0-9a-fA-F]{64}\*32\*[0-9a-fA-F]{64}",
+     [("PDF 1.4 - 1.6", 10500)]),
+    ("$pdf$4*4*", r"\$pdf\$4\*4\*128\*-?\d+\*[01]\*16\*[0-9a-fA-F]{32}\*32\*[0-9a-fA-F]{64}\*32\*[0-9a-fA-F]{64}",
+     [("PDF 1.4 - 1.6", 10500)]),
+    ("$pdf$5*5*", r"\$pdf\$5\*5\*256\*-?\d+\*[01]\*\d+\*[0-9a-fA-F]+(?:\*\d+\*[0-9a-fA-F]+)+",
+     [("PDF 1.7 Level 3", 10600)]),
+    ("$pdf$5*6*", r"\$pdf\$5\*6\*256\*-?\d+\*[01]\*\d+\*[0-9a-fA-F]+(?:\*\d+\*[0-9a-fA-F]+)+",
+     [("PDF 1.7 Level 8", 10700)]),
+    ("$zip2$", r"\$zip2\$\*\d\*\d\*\d\*[0-9a-fA-F]+\*[0-9a-fA-F]+\*[0-9a-fA-F]+\*[0-9a-fA-F]+\*[0-9a-fA-F]{20}\*\$/zip2\$",
+     [("WinZip", 13600)]),
+    ("$rar5$", r"\$rar5\$16\$[0-9a-fA-F]{32}\$\d+\$[0-9a-fA-F]{32}\$8\$[0-9a-fA-F]{16}", [("RAR5", 13000)]),
+    ("$7z$", r"\$7z\$\d+\$\d+\$\d+\$[^$]*\$\d+\$[0-9a-fA-F]+\$\d+\$\d+\$\d+\$[0-9a-fA-F]+(?:\$[^$]*)*", [("7-Zip", 11600)]),
+    ("$keepass$", r"\$keepass\$\*[12]\*\d+\*\d+\*[0-9a-fA-F*]+", [("KeePass", 13400)]),
+    ("$bitcoin$", r"\$bitcoin\$\d+\$[0-9a-fA-F]+\$\d+\$[0-9a-fA-F]+\$\d+\$\d+\$[0-9a-fA-F]+\$\d+\$[0-9a-fA-F]+",
+     [("Bitcoin wallet.dat", 11300)]),
+    ("SCRYPT:", r"SCRYPT:\d+:\d+:\d+:[A-Za-z0-9+/=]+:[A-Za-z0-9+/=]+", [("scrypt", 8900)]),
+    ("pbkdf2_sha256$", r"pbkdf2_sha256\$\d+\$[^$]+\$[A-Za-z0-9+/]{43}=", [("Django PBKDF2-SHA256", 10000)]),
+    ("sha1$", r"sha1\$[^$]+\$[0-9a-fA-F]{40}", [("Django SHA1", 124)]),
+    ("{SSHA512}", r"\{SSHA512\}[A-Za-z0-9+/]{86,}={0,2}", [("SSHA-512 (Base64)", 1711)]),
+    ("{SSHA}", r"\{SSHA\}[A-Za-z0-9+/]{27,}={0,2}", [("SSHA-1 (Base64)", 111)]),
+    ("{SHA}", r"\{SHA\}[A-Za-z0-9+/]{27}=", [("SHA-1 (Base64)", 101)]),
+    ("0x0100", r"0x0100[0-9a-fA-F]{88}", [("MSSQL (2000)", 131)]),
+    ("0x0100", r"0x0100[0-9a-fA-F]{48}", [("MSSQL (2005)", 132)]),
+    ("0x0200", r"0x0200[0-9a-fA-F]{136}", [("MSSQL (2012, 2014)", 1731)]),
+]
+# Precompiled and indexed by first character; longest prefix is tried first
+HASH_PREFIX_INDEX = {}
+for _prefix, _pattern, _candidates in sorted(HASH_PREFIX_TABLE, key=lambda entry: len(entry[0]), reverse=True):
+    HASH_PREFIX_INDEX.setdefault(_prefix[0], []).append((_prefix, re.compile(_pattern), _candidates))
+
+HASH_HEX_LENGTHS = {
+    8: [("CRC32", 11500)],
+    16: [("MySQL323", 200), ("LM", 3000), ("Half MD5", 5100)],
+    32: [("MD5", 0), ("NTLM", 1000), ("MD4", 900)],
+    40: [("SHA1", 100), ("RIPEMD-160", 6000)],
+    56: [("SHA2-224", 1300), ("SHA3-224", 17300)],
+    64: [("SHA2-256", 1400), ("SHA3-256", 17400), ("Keccak-256", 17800)],
+    96: [("SHA2-384", 10800), ("SHA3-384", 17500)],
+    128: [("SHA2-512", 1700), ("SHA3-512", 17600), ("Whirlpool", 6100)],
+}
+HASH_HEX_RE = re.compile(r"[0-9a-fA-F]+")
+
+# (regex, candidates, group holding the crackable part or 0 for the whole line)
+HASH_PATTERN_TABLE = [
+    (re.compile(r"[^:]+:\d+:[0-9a-fA-F]{32}:([0-9a-fA-F]{32}):::.*"), [("NTLM (pwdump)", 1000)], 1),
+    (re.compile(r"[^:]+::[^:]+:[0-9a-fA-F]{16}:[0-9a-fA-F]{32}:[0-9a-fA-F]+"), [("NetNTLMv2", 5600)], 0),
+    (re.compile(r"[^:]+::[^:]*:[0-9a-fA-F]{48}:[0-9a-fA-F]{48}:[0-9a-fA-F]{16}"), [("NetNTLMv1", 5500)], 0),
+    (re.compile(r"\*[0-9a-fA-F]{40}"), [("MySQL 4.1+", 300)], 0),
+    (re.compile(r"[0-9a-fA-F]{32}:.+"), [("md5($pass.$salt)", 10), ("md5($salt.$pass)", 20)], 0),
+    (re.compile(r"[0-9a-fA-F]{40}:.+"), [("sha1($pass.$salt)", 110), ("sha1($salt.$pass)", 120)], 0),
+    # 2 salt chars + 11 hash chars. The last char only carries 4 bits, and the hash part
+    # must mix upper and lower case, which keeps ordinary 13-letter words out.
+    (re.compile(r"[./0-9A-Za-z]{2}(?=[./0-9A-Za-z]*[A-Z])(?=[./0-9A-Za-z]*[a-z])[./0-9A-Za-z]{10}[.26AEIMQUYcgkosw]"),
+     [("descrypt", 1500)], 0),
+]
+
+def identify_hash(line):
+    """Returns (candidates, hash) for one line, or (None, line) when unrecognised"""
+    if not line: return None, line
+    for prefix, pattern, candidates in HASH_PREFIX_INDEX.get(line[0], ()):
+        if line.startswith(prefix) and pattern.fullmatch(line):
+            return candidates, line
+
+    candidates = HASH_HEX_LENGTHS.get(len(line))
+    if candidates and HASH_HEX_RE.fullmatch(line):
+        return candidates, line
+
+    for pattern, candidates, group in HASH_PATTERN_TABLE:
+        m = pattern.fullmatch(line)
+        if m:
+            return candidates, m.group(group)
+    return None, line
+
+def identify_hash_file(filepath, out_dir=None, stop_flag=None):
+    """
+    Streams a hash list and classifies every line into one group per hashcat
+    mode. With out_dir set, each group is also written to its own file, ready
+    to be cracked as a separate job.
+    """
+    groups = {}
+    handles = {}
+    total = unknown = 0
+    base = os.path.splitext(os.path.basename(filepath))[0]
+    try:
+        # latin-1 maps every byte to one char, so odd salts are written back unchanged
+        with open(filepath, "r", encoding="latin-1") as f:
+            for line in f:
+                if stop_flag is not None and stop_flag.is_set(): break
+                line = line.strip()
+                if not line or line.startswith("#"): continue
+                total += 1
+
+                candidates, value = identify_hash(line)
+                if candidates is None:
+                    unknown += 1
+                    continue
+
+                name, mode = candidates[0]
+                key = mode if mode is not None else name
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = {"mode": mode, "names": [], "alternatives": candidates[1:],
+                                           "count": 0, "extracted": False, "file": None}
+                    if out_dir and mode is not None:
+                        group["file"] = os.path.join(out_dir, f"{base}.m{mode}.txt")
+                        handles[mode] = open(group["file"], "w", encoding="latin-1")
+                if name not in group["names"]:
+                    group["names"].append(name)
+                group["count"] += 1
+                group["extracted"] = group["extracted"] or value != line
+                if group["file"]:
+                    handles[mode].write(value + "\n")
+    finally:
+        for handle in handles.values():
+            handle.close()
+    return {"total": total, "unknown": unknown, "groups": groups}
+
+# --- Archive Scanner ---
+# (offset, magic, type) checked against the first bytes of every stream
+FILE_SIGNATURES = [
+    (0, b"\x89PNG\r\n\x1a\n", "png"), (0, b"\xff\xd8\xff", "jpeg"), (0, b"GIF8", "gif"),
+    (0, b"BM", "bmp"), (0, b"%PDF", "pdf"), (0, b"\x7fELF", "elf"), (0, b"MZ", "pe"),
+    (0, b"PK\x03\x04", "zip"), (0, b"PK\x05\x06", "zip"), (0, b"\x1f\x8b", "gzip"),
+    (0, b"BZh", "bz2"), (0, b"\xfd7zXZ\x00", "xz"), (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+    (0, b"Rar!\x1a\x07", "rar"), (0, b"RIFF", "riff"), (0, b"SQLite format 3\x00", "sqlite"),
+    (0, b"ID3", "mp3"), (0, b"fLaC", "flac"), (257, b"ustar", "tar"),
+]
+ARCHIVE_TYPES = ("zip", "tar", "gzip", "bz2", "xz")
+FLAG_RE = re.compile(rb"[A-Za-z0-9_]{0,16}(?:flag|ctf|htb|thm)[A-Za-z0-9_]{0,16}\{[ -|~]{1,200}\}", re.IGNORECASE)
+ARCHIVE_CHUNK = 1024 * 1024
+ARCHIVE_BOMB_RATIO = 100                   # reported as zip-bomb-like, scanning continues
+ARCHIVE_BOMB_MIN_SIZE = 16 * 1024 * 1024   # ...once a member expands to at least this much
+ARCHIVE_MAX_MEMBER = 512 * 1024 * 1024     # decompressed bytes read from a single member
+ARCHIVE_MAX_TOTAL = 2 * 1024 * 1024 * 1024 # decompressed bytes read in one scan
+
+def detect_signature(head):
+    for offset, magic, kind in FILE_SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            return kind
+    if head and all(32 <= b < 127 or b in (9, 10, 13) for b in head):
+        return "text"
+    return "data"
+
+def find_flags(stream, stop_flag=None):
+    """Scans a stream chunk by chunk, keeping an overlap so flags split across chunks are caught"""
+    flags = []
+    tail = b""
+    while True:
+        if stop_flag is not None and stop_flag.is_set(): break
+        chunk = stream.read(ARCHIVE_CHUNK)
+        if not chunk: break
+        data = tail + chunk
+        for m in FLAG_RE.finditer(data):
+            flag = m.group().decode("latin-1")
+            if flag not in flags:
+                flags.append(flag)
+        tail = data[-256:]
+    return flags
+
+class MemberStream(object):
+    """
+    Forward-only reader over a member stream. Replays the sniffed header bytes,
+    counts what is read and stops (marking itself truncated) at the per-member
+    and per-scan limits, so a bomb is never fully decompressed. Only leaf
+    streams are charged to the per-scan budget; a container's bytes are
+    charged through the members read out of it.
+    """
+    def __init__(self, stream, ctx, limited=True, parent=None):
+        self.stream = stream
+        self.ctx = ctx
+        self.limited = limited
+        self.parent = parent
+        self.leaf = True
+        self.head = stream.read(512)
+        self.pending = self.head
+        self.pos = 0
+        self.truncated = False
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.read(ARCHIVE_CHUNK)
+                if not chunk: break
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+        if self.pending:
+            data, self.pending = self.pending[:size], self.pending[size:]
+        else:
+            try:
+                data = self.stream.read(size)
+            except Exception:
+                self._check_parent()
+                raise
+            if not data:
+                self._check_parent()
+        if self.limited:
+            left = ARCHIVE_MAX_MEMBER - self.pos
+            if self.leaf:
+                left = min(left, self.ctx["budget_left"])
+            left = max(left, 0)
+            if len(data) > left:
+                data = data[:left]
+                self.truncated = True
+            if self.leaf:
+                self.ctx["budget_left"] -= len(data)
+        self.pos += len(data)
+        return data
+
+    def _check_parent(self):
+        # Ending early because the container was cut off is a truncation too
+        if self.parent is not None and self.parent.truncated:
+            self.truncated = True
+
+def _archive_node(name, depth, kind, size=None, csize=None, error=None):
+    return {"name": name, "depth": depth, "type": kind, "size": size, "csize": csize, "ratio": 0.0,
+            "bomb": False, "truncated": False, "spilled": False, "flags": [], "error": error}
+
+def _scan_zip(node, stream, fileobj, depth, nodes, ctx):
+    import tempfile, zipfile
+    spool = None
+    if fileobj is None:
+        # zipfile needs to seek: keep the member in memory up to the budget, spill beyond it
+        spool = tempfile.SpooledTemporaryFile(max_size=ctx["mem_budget"])
+        shutil.copyfileobj(stream, spool, ARCHIVE_CHUNK)
+        spool.seek(0)
+        node["spilled"] = stream.pos > ctx["mem_budget"]
+        fileobj = spool
+    try:
+        with zipfile.ZipFile(fileobj) as zf:
+            node["flags"] = [m.group().decode("latin-1") for m in FLAG_RE.finditer(zf.comment)]
+            for info in zf.infolist():
+                if ctx["stop_flag"] is not None and ctx["stop_flag"].is_set(): return
+                if info.is_dir(): continue
+                if info.flag_bits & 0x1:
+                    nodes.append(_archive_node(info.filename, depth + 1, "encrypted", info.file_size,
+                                               info.compress_size, "encrypted member"))
+                    continue
+                if ctx["budget_left"] <= 0:
+                    nodes.append(_archive_node(info.filename, depth + 1, "skipped", info.file_size,
+                                               info.compress_size, "scan limit reached"))
+                    continue
+                with zf.open(info) as member:
+                    _scan_stream(info.filename, MemberStream(member, ctx, parent=stream), depth + 1, nodes, ctx,
+                                 size=info.file_size, csize=info.compress_size)
+    finally:
+        if spool is not None:
+            spool.close()
+
+def _scan_stream(name, stream, depth, nodes, ctx, size=None, csize=None, fileobj=None):
+    """Identifies one stream, then either walks it as a container or scans it for flags"""
+    import bz2, gzip, lzma, tarfile
+    kind = detect_signature(stream.head)
+    node = _archive_node(name, depth, kind, size, csize)
+    nodes.append(node)
+    stream.leaf = kind not in ARCHIVE_TYPES or depth >= ctx["max_depth"]
+
+    try:
+        if stream.leaf:
+            node["flags"] = find_flags(stream, ctx["stop_flag"])
+        elif kind == "zip":
+            _scan_zip(node, stream, fileobj, depth, nodes, ctx)
+        elif kind == "tar":
+            with tarfile.open(fileobj=stream, mode="r|") as tf:
+                for info in tf:
+                    if ctx["stop_flag"] is not None and ctx["stop_flag"].is_set(): break
+                    if not info.isfile(): continue
+                    _scan_stream(info.name, MemberStream(tf.extractfile(info), ctx, parent=stream), depth + 1, nodes, ctx,
+                                 size=info.size, csize=info.size)
+        else:
+            inner = name
+            for suffix in (".gz", ".tgz", ".bz2", ".xz"):
+                if inner.lower().endswith(suffix):
+                    inner = inner[:-len(suffix)] + (".tar" if suffix == ".tgz" else "")
+                    break
+            opener = {"gzip": gzip.GzipFile, "bz2": bz2.BZ2File, "xz": lzma.LZMAFile}[kind]
+            with (opener(fileobj=stream) if kind == "gzip" else opener(stream)) as member:
+                start = len(nodes)
+                _scan_stream(inner, MemberStream(member, ctx, parent=stream), depth + 1, nodes, ctx)
+                # Compressed size of a single-stream payload is what its container gave up
+                nodes[start]["csize"] = stream.pos
+    except Exception as e:
+        node["error"] = str(e)
+
+    node["truncated"] = stream.truncated
+    if node["size"] is None or stream.truncated:
+        node["size"] = max(node["size"] or 0, stream.pos)
+
+def scan_archive(filepath, mem_budget=64 * 1024 * 1024, max_depth=8, stop_flag=None):
+    """
+    Walks zip/tar/gzip/bz2/xz containers recursively without extracting to disk.
+    Members are streamed; only nested zips (which need seeking) are buffered, and
+    only those larger than mem_budget spill to a temp file.
+    Returns a flat, depth-annotated list of nodes in tree order.
+    """
+    nodes = []
+    ctx = {"mem_budget": mem_budget, "max_depth": max_depth, "stop_flag": stop_flag,
+           "budget_left": ARCHIVE_MAX_TOTAL}
+    size = os.path.getsize(filepath)
+    with open(filepath, "rb") as f:
+        _scan_stream(os.path.basename(filepath), MemberStream(f, ctx, limited=False), 0, nodes, ctx,
+                     size=size, csize=size, fileobj=f)
+    for node in nodes:
+        if node["size"] and node["csize"]:
+            node["ratio"] = node["size"] / node["csize"]
+            node["bomb"] = node["ratio"] >= ARCHIVE_BOMB_RATIO and node["size"] >= ARCHIVE_BOMB_MIN_SIZE
+    return nodes
+
+# --- Tool Probe Cache ---
+TOOL_CACHE_FILE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+                               "steg-suite", "tools.json")
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return None
+
+def probe_tools(tools, cache_file=TOOL_CACHE_FILE):
+    """
+    Resolves {tool: command} to {tool: path or None}. Results are cached on disk,
+    keyed on PATH, the mtime of every PATH directory and of each binary, so an
+    unchanged system costs a few stat() calls instead of a PATH walk per tool.
+    Returns (results, used_cache).
+    """
+    import json
+    path_env = os.environ.get("PATH", "")
+    dirs = {d: _mtime(d) for d in path_env.split(os.pathsep) if d}
+    try:
+        with open(cache_file, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cached = cache.get("tools", {}) if cache.get("path") == path_env and cache.get("dirs") == dirs else {}
+
+    entries = {}
+    dirty = False
+    for tool, cmd in tools.items():
+        entry = cached.get(tool)
+        if not entry or entry["cmd"] != cmd or _mtime(entry["resolved"] or cmd) != entry["mtime"]:
+            resolved = shutil.which(cmd) or (os.path.abspath(cmd) if os.path.exists(cmd) else None)
+            entry = {"cmd": cmd, "resolved": resolved, "mtime": _mtime(resolved or cmd)}
+            dirty = True
+        entries[tool] = entry
+
+    if dirty:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "w") as f:
+                json.dump({"path": path_env, "dirs": dirs, "tools": entries}, f)
+        except OSError as e:
+            print(f"Error saving tool cache: {e}")
+    return {tool: entry["resolved"] for tool, entry in entries.items()}, not dirty
+
 # --- Main Application ---
-BaseClass = ctk.CTk
-if HAS_DND:
-    class StegoBase(ctk.CTk, DnDWrapper):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.TkdndVersion = TkinterDnD._require(self)
-    BaseClass = StegoBase
-
-class StegoApp(BaseClass):
+class StegoApp(ctk.CTk, DnDWrapper):
     def __init__(self):
         super().__init__()
         
-        # 1. LOAD EXTERNAL CONFIGURATION
-        self.app_config = self.load_config_from_file()
-        self.tool_paths = self.load_tool_paths_from_file()
-        self.tool_descriptions = self.load_tooltips_from_file()
+        # 1. LOAD EXTERNAL CONFIGURATION (tooltips.txt is read after first paint)
+        self.app_config = {
+            "theme": "dark", 
+            "color_theme": "blue",
+            "default_dir": os.path.expanduser("~"),
+            "font_size": "13"
+        }
+        self.app_config.update(self.load_kv_file("config.txt"))
+        self.tool_paths = self.load_kv_file("config_application.txt")
         self.is_windows = platform.system() == "Windows"
 
         # Apply Configuration
@@ -98,20 +818,31 @@ class StegoApp(BaseClass):
         self.tool_display_map = {
             "binwalk": "Binwalk", "zsteg": "Zsteg", "pngcheck": "Pngcheck",
             "steghide": "Steghide", "stegseek": "Stegseek", "jsteg": "Jsteg",
-            "stegsnow": "Stegsnow", "hexdump": "Hexdump", "hashcat": "Hashcat"
+            "stegsnow": "Stegsnow", "hexdump": "Hexdump", "hashcat": "Hashcat",
+            "archive": "Archive Scan", "snow": "Snow Decoder", "hashid": "Hash Identify"
         }
 
+        # Implemented in Python, no binary to look for
+        self.builtin_tools = {"archive", "snow", "hashid"}
+
         self.tool_compatibility = {
             "png": ["binwalk", "zsteg", "pngcheck", "steghide", "stegseek", "hexdump", "exiftool"],
             "jpeg": ["binwalk", "steghide", "stegseek", "jsteg", "hexdump", "hashcat","exiftool"],
             "jpg": ["binwalk", "steghide", "stegseek", "jsteg", "hexdump", "hashcat","exiftool"],
-            "txt": ["stegsnow", "hexdump", "hashcat","exiftool"],
-            "zip": ["binwalk", "hexdump", "gunzip","exiftool"],
-            "hash": ["hashcat", "hexdump","exiftool"]
+            "txt": ["stegsnow", "snow", "hexdump", "hashcat", "hashid","exiftool"],
+            "zip": ["archive", "binwalk", "hexdump", "gunzip","exiftool"],
+            "gz": ["archive", "binwalk", "hexdump", "exiftool"],
+            "tgz": ["archive", "binwalk", "hexdump", "exiftool"],
+            "tar": ["archive", "binwalk", "hexdump", "exiftool"],
+            "bz2": ["archive", "binwalk", "hexdump", "exiftool"],
+            "xz": ["archive", "binwalk", "hexdump", "exiftool"],
+            "hash": ["hashcat", "hashid", "hexdump","exiftool"]
         }
 
         self.selected_file = ""
         self.tool_widgets = {}
+        self.available_tools = {}
+        self.startup_times = {"imports": IMPORT_TIME}
         self._last_resize_time = 0
         self.stop_flag = threading.Event() 
 
@@ -124,12 +855,28 @@ class StegoApp(BaseClass):
         self._setup_sidebar()
         self._setup_main_area()
         self._setup_keybindings()
-        
-        if HAS_DND:
-            self._setup_drag_drop()
-        
-        # Run system check after UI loads
-        self.after(500, self.check_system_dependencies)
+        self.startup_times["window"] = time.perf_counter() - STARTUP_T0
+
+        # Left bound after it fires: unbind() would drop every <Expose> binding on the root
+        self.bind("<Expose>", self._on_first_expose, add="+")
+
+    def _on_first_expose(self, event=None):
+        if "first_paint" in self.startup_times: return
+        # The window is mapped and exposed; flush the redraws queued behind it before timing
+        self.update_idletasks()
+        self.startup_times["first_paint"] = time.perf_counter() - STARTUP_T0
+        self.after_idle(self._run_deferred_setup)
+
+    def _run_deferred_setup(self):
+        # Each step is isolated so one failure cannot skip the others
+        for step in (self._setup_drag_drop, self._setup_tooltips, self.check_system_dependencies):
+            try:
+                step()
+            except Exception as e:
+                self.log(f"[!] Startup step {step.__name__} failed: {e}\n", "error")
+        t = self.startup_times
+        self.log(f"[~] Startup: imports {t['imports'] * 1000:.0f} ms | window {t['window'] * 1000:.0f} ms | "
+                 f"first paint {t['first_paint'] * 1000:.0f} ms\n", "info")
 
     # --- Cross-Platform Helper ---
     def quote_path(self, path):
@@ -142,53 +889,23 @@ class StegoApp(BaseClass):
         return shlex.quote(path)
 
     # --- Configuration Loaders ---
-    def load_config_from_file(self):
-        config = {
-            "theme": "dark", 
-            "color_theme": "blue",
-            "default_dir": os.path.expanduser("~"),
-            "font_size": "13"
-        }
-        try:
-            if os.path.exists("config.txt"):
-                with open("config.txt", "r") as f:
-                    for line in f:
-                        if "=" in line and not line.strip().startswith("#"):
-                            key, value = line.strip().split("=", 1)
-                            config[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"Error loading config: {e}")
-        return config
-
-    def load_tool_paths_from_file(self):
-        paths = {}
+    def load_kv_file(self, filename):
+        """Shared parser for the key=value text files (config, tool paths, tooltips)"""
+        values = {}
         try:
-            if os.path.exists("config_application.txt"):
-                with open("config_application.txt", "r") as f:
+            if os.path.exists(filename):
+                with open(filename, "r") as f:
                     for line in f:
                         if "=" in line and not line.strip().startswith("#"):
                             key, value = line.strip().split("=", 1)
-                            paths[key.strip()] = value.strip()
+                            values[key.strip()] = value.strip()
         except Exception as e:
-            print(f"Error loading tool paths: {e}")
-        return paths
+            print(f"Error loading {filename}: {e}")
+        return values
 
     def get_tool_cmd(self, tool_name):
         return self.tool_paths.get(tool_name, tool_name)
 
-    def load_tooltips_from_file(self):
-        tooltips = {}
-        try:
-            if os.path.exists("tooltips.txt"):
-                with open("tooltips.txt", "r") as f:
-                    for line in f:
-                        if "=" in line and not line.strip().startswith("#"):
-                            key, value = line.strip().split("=", 1)
-                            tooltips[key.strip()] = value.strip()
-        except Exception as e:
-            print(f"Error loading tooltips: {e}")
-        return tooltips
-
     # --- UI Setup Helpers ---
     def _setup_layout(self):
         self.grid_columnconfigure(0, weight=1, minsize=200) 
@@ -212,9 +929,6 @@ class StegoApp(BaseClass):
             cb = ctk.CTkCheckBox(self.scrollable_tools, text=display_name, variable=v, font=("Consolas", 14))
             cb.pack(pady=8, padx=10, anchor="w")
             self.tool_widgets[internal_name] = {"var": v, "widget": cb}
-            
-            if internal_name in self.tool_descriptions:
-                ToolTip(cb, self.tool_descriptions[internal_name])
 
         self.btn_select_all = ctk.CTkButton(
             self.sidebar, text="Select All", 
@@ -289,7 +1003,15 @@ class StegoApp(BaseClass):
         self.bind("<Escape>", lambda e: self.stop_execution())
         self.after(1000, lambda: self.log("Shortcuts: Ctrl+O (Load) | Ctrl+R (Run) | Ctrl+S (Save) | ESC (Stop)\n"))
 
+    def _setup_tooltips(self):
+        tool_descriptions = self.load_kv_file("tooltips.txt")
+        for internal_name, data in self.tool_widgets.items():
+            if internal_name in tool_descriptions:
+                ToolTip(data["widget"], tool_descriptions[internal_name])
+
     def _setup_drag_drop(self):
+        if not HAS_DND: return
+        self.TkdndVersion = TkinterDnD._require(self)
         self.drop_target_register(DND_FILES)
         self.dnd_bind('<<Drop>>', self.handle_drop)
 
@@ -384,16 +1106,38 @@ class StegoApp(BaseClass):
     # --- Core Logic ---
     def check_system_dependencies(self):
         self.log(">>> [SYSTEM CHECK] Verifying tools...\n")
+        tools = {t: self.get_tool_cmd(t) for t in self.tool_display_map if t not in self.builtin_tools}
+        tools["exiftool"] = self.get_tool_cmd("exiftool")
+        tools["file"] = "file"
+        threading.Thread(target=self._probe_worker, args=(tools,), daemon=True).start()
+
+    def _probe_worker(self, tools):
+        start = time.perf_counter()
+        results, cached = probe_tools(tools)
+        elapsed = time.perf_counter() - start
+        self.after(0, lambda: self._apply_probe_results(results, cached, elapsed))
+
+    def _apply_probe_results(self, results, cached, elapsed):
+        self.available_tools = results
         for tool in self.tool_display_map.keys():
-            cmd = self.get_tool_cmd(tool)
-            # Cross-platform check
-            if shutil.which(cmd) is not None or os.path.exists(cmd):
+            if tool in self.builtin_tools:
+                self.log(f"[+] Built-in: {tool}\n", "success")
+            elif results[tool]:
                 self.log(f"[+] Found: {tool}\n", "success")
             else:
                 self.tool_widgets[tool]["widget"].configure(text_color="#ff5555", state="disabled")
-                self.log(f"[-] Missing: {tool} (Command: {cmd})\n", "error")
+                self.log(f"[-] Missing: {tool} (Command: {self.get_tool_cmd(tool)})\n", "error")
+        source = "cache" if cached else "PATH scan"
+        self.log(f"[~] Tool probe: {elapsed * 1000:.0f} ms ({source})\n", "info")
         self.log("-" * 40 + "\n")
 
+    def is_tool_available(self, tool_name):
+        # Falls back to a direct lookup if the background probe has not finished yet
+        if tool_name in self.available_tools:
+            return self.available_tools[tool_name] is not None
+        cmd = self.get_tool_cmd(tool_name)
+        return shutil.which(cmd) is not None or os.path.exists(cmd)
+
     def browse_file_native(self):
         file_path = ""
         initial_dir = self.app_config.get("default_dir", os.path.expanduser("~"))
@@ -425,11 +1169,12 @@ class StegoApp(BaseClass):
         # 1. Type Identification
         try:
             # Linux 'file' command is best, but not default on Windows
-            if shutil.which("file"):
+            if self.is_tool_available("file"):
                 res = subprocess.check_output(["file", self.selected_file], stderr=subprocess.STDOUT, timeout=10).decode()
                 self.log(f"{res}\n")
             else:
                 # Windows Fallback: Use standard python lib
+                import mimetypes
                 mime, _ = mimetypes.guess_type(self.selected_file)
                 self.log(f"Detected (MIME): {mime or 'Unknown'}\n")
         except Exception as e:
@@ -438,7 +1183,7 @@ class StegoApp(BaseClass):
         # 2. ExifTool (Cross-platform)
         try:
             exif_cmd = self.get_tool_cmd("exiftool")
-            if shutil.which(exif_cmd) or os.path.exists(exif_cmd):
+            if self.is_tool_available("exiftool"):
                 self.log("-" * 15 + " EXIF METADATA " + "-" * 15 + "\n", "info")
                 exif_out = subprocess.check_output(
                     [exif_cmd, self.selected_file], 
@@ -475,6 +1220,7 @@ class StegoApp(BaseClass):
             "pngcheck": self._prompt_pngcheck, "jsteg": self._prompt_jsteg,
             "stegseek": self._prompt_stegseek, "hashcat": self._prompt_hashcat,
             "stegsnow": self._prompt_stegsnow, "hexdump": self._prompt_hexdump,
+            "archive": self._prompt_archive, "snow": self._prompt_snow, "hashid": self._prompt_hashid,
             "steghide": lambda: [self.get_tool_cmd("steghide"), "info", self.selected_file]
         }
         return handlers[tool_name]() if tool_name in handlers else [self.get_tool_cmd(tool_name), self.selected_file]
@@ -556,6 +1302,13 @@ class StegoApp(BaseClass):
                 return [hashcat_cmd, "-a", "0", "-m", str(mt), self.selected_file, wl, "--show"]
         return None
 
+    def _prompt_hashid(self):
+        out_dir = None
+        if messagebox.askyesno("Hash Identify", "Split hashes into one file per mode for cracking?", parent=self):
+            out_dir = filedialog.askdirectory(title="Select output folder", initialdir=os.path.dirname(self.selected_file), parent=self)
+            if not out_dir: return None
+        return {"type": "INTERNAL_HASHID", "out_dir": out_dir}
+
     def _prompt_stegsnow(self):
         stegsnow_cmd = self.get_tool_cmd("stegsnow")
         mode = messagebox.askquestion("Stegsnow", "Reveal hidden data? (No to HIDE)", type='yesnocancel', parent=self)
@@ -571,6 +1324,18 @@ class StegoApp(BaseClass):
             if msg and path: return [stegsnow_cmd, "-C", "-m", msg, self.selected_file, path]
         return None
 
+    def _prompt_snow(self):
+        wl = None
+        if messagebox.askyesno("Snow Decoder", "Try passphrases from a wordlist?", parent=self):
+            wl = filedialog.askopenfilename(title="Select Wordlist", parent=self)
+            if not wl: return None
+        paths = [self.selected_file]
+        if messagebox.askyesno("Snow Decoder", "Sweep every text file in the target's folder?", parent=self):
+            folder = os.path.dirname(self.selected_file) or "."
+            paths = [os.path.join(folder, n) for n in sorted(os.listdir(folder))
+                     if n.lower().endswith((".txt", ".log")) and os.path.isfile(os.path.join(folder, n))]
+        return {"type": "INTERNAL_SNOW", "paths": paths, "wordlist": wl}
+
     def _prompt_hexdump(self):
         # On Windows, system 'hexdump' likely doesn't exist.
         # We rely on internal Python fallback unless it's External Mode.
@@ -602,6 +1367,12 @@ class StegoApp(BaseClass):
 
         return None
 
+    def _prompt_archive(self):
+        budget = simpledialog.askinteger("Archive Scan", "Memory budget per member (MB):\nLarger members spill to a temp file.",
+                                         initialvalue=64, minvalue=1, parent=self)
+        if budget is None: return None
+        return {"type": "INTERNAL_ARCHIVE", "mem_budget": budget * 1024 * 1024}
+
     # --- Pure Python Hexdump Implementation ---
     def do_internal_hexdump(self, filepath, pattern=None, max_lines=100):
         """Cross-platform hexdump generator"""
@@ -643,6 +1414,91 @@ class StegoApp(BaseClass):
         except Exception as e:
             return f"Error reading file: {e}"
 
+    # --- Native SNOW Decoder ---
+    def do_internal_snow(self, paths, wordlist=None):
+        """Bulk SNOW sweep, logging each file as its scan finishes"""
+        if not snow_huffcodes():
+            self.log("[*] huffcode.h (SNOW source) not found. Compressed (-C) messages will be skipped.\n", "warning")
+        hits = 0
+        try:
+            passwords = []
+            if wordlist:
+                with open(wordlist, "r", encoding="utf-8", errors="surrogateescape") as f:
+                    passwords = [line.rstrip("\r\n") for line in f]
+            for res in snow_scan_files(paths, passwords, self.stop_flag):
+                name = os.path.basename(res["file"])
+                if res["error"]:
+                    self.log(f"[-] {name}: {res['error']}\n", "error")
+                    continue
+                if not res["found"]: continue
+
+                best = res["candidates"][0] if res["candidates"] else None
+                if best is None or best["score"] < 0.9:
+                    self.log(f"[!] {name}: {res['bits']} whitespace bits, no readable decode.\n", "warning")
+                    continue
+                hits += 1
+                pwd = best["password"]
+                pwd = pwd.encode("utf-8", "surrogateescape").decode("utf-8", "replace") if pwd else "none"
+                text = best["data"].decode("latin-1")
+                self.log(f"[+] {name} ({best['variant']}, password: {pwd}):\n{text}\n", "success")
+        except Exception as e:
+            self.log(f"[-] Snow scan failed: {e}\n", "error")
+            return
+        self.log(f"[~] Scanned {len(paths)} file(s), {hits} message(s) recovered.\n", "info")
+
+    # --- Native Hash Identifier ---
+    def do_internal_hashid(self, filepath, out_dir=None):
+        """Per-mode counts and hashcat suggestions for a hash list"""
+        try:
+            res = identify_hash_file(filepath, out_dir, self.stop_flag)
+        except Exception as e:
+            self.log(f"[-] Error reading file: {e}\n", "error")
+            return
+
+        self.log(f"[~] {res['total']} hash(es), {res['unknown']} unrecognised.\n", "info")
+        hashcat_cmd = self.get_tool_cmd("hashcat")
+        for group in sorted(res["groups"].values(), key=lambda g: g["count"], reverse=True):
+            mode = group["mode"]
+            name = " / ".join(group["names"])
+            mode_str = f"-m {mode}" if mode is not None else "no hashcat mode"
+            self.log(f"[+] {group['count']:>10}  {name} ({mode_str})\n", "success")
+            if group["alternatives"]:
+                alts = ", ".join(f"{n} (-m {m})" for n, m in group["alternatives"])
+                self.log(f"      or: {alts}\n")
+            if mode is not None and group["extracted"] and not group["file"]:
+                self.log("      Hashes are embedded in longer lines. Re-run with splitting to get a crackable file.\n")
+            elif mode is not None:
+                target = self.quote_path(group["file"] or filepath)
+                self.log(f"      {hashcat_cmd} -a 0 -m {mode} {target} <wordlist>\n")
+
+    # --- Native Archive Scanner ---
+    def do_internal_archive(self, filepath, mem_budget):
+        """Logs the member tree of an archive with ratios, bomb warnings and flags"""
+        try:
+            nodes = scan_archive(filepath, mem_budget, stop_flag=self.stop_flag)
+        except Exception as e:
+            self.log(f"[-] Error reading archive: {e}\n", "error")
+            return
+
+        for node in nodes:
+            indent = "  " * node["depth"]
+            size = f">= {node['size']}" if node["truncated"] else f"{node['size']}"
+            line = f"{indent}{node['name']}  [{node['type']}]  {size} B"
+            if node["depth"] and node["csize"] != node["size"]:
+                line += f"  (ratio {node['ratio']:.1f}x)"
+            if node["spilled"]:
+                line += "  (spilled to disk)"
+            self.log(line + "\n", "warning" if node["bomb"] else "normal")
+            if node["bomb"]:
+                self.log(f"{indent}  [!] Zip-bomb-like compression ratio\n", "warning")
+            if node["truncated"]:
+                self.log(f"{indent}  [!] Stopped reading at the scan limit, size is a lower bound\n", "warning")
+            if node["error"]:
+                self.log(f"{indent}  [-] {node['error']}\n", "error")
+            for flag in node["flags"]:
+                self.log(f"{indent}  [+] FLAG: {flag}\n", "success")
+        self.log(f"[~] {len(nodes)} node(s) scanned.\n", "info")
+
     # --- Execution Logic ---
     def stop_execution(self):
         self.stop_flag.set()
@@ -688,6 +1544,21 @@ class StegoApp(BaseClass):
                 self.log("-" * 40 + "\n")
                 continue
 
+            if isinstance(cmd, dict) and cmd.get("type") == "INTERNAL_ARCHIVE":
+                self.do_internal_archive(self.selected_file, cmd["mem_budget"])
+                self.log("-" * 40 + "\n")
+                continue
+
+            if isinstance(cmd, dict) and cmd.get("type") == "INTERNAL_HASHID":
+                self.do_internal_hashid(self.selected_file, cmd["out_dir"])
+                self.log("-" * 40 + "\n")
+                continue
+
+            if isinstance(cmd, dict) and cmd.get("type") == "INTERNAL_SNOW":
+                self.do_internal_snow(cmd["paths"], cmd["wordlist"])
+                self.log("-" * 40 + "\n")
+                continue
+
             # Regular Process execution
             try:
                 # Windows needs shell=True for complex commands (redirection >)
@@ -0,0 +1,117 @@
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import tempfile
+import zipfile
+
+import main
+
+
+def make_zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+def make_tar_gz(path, members):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tf:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    path.write_bytes(gzip.compress(buf.getvalue()))
+
+
+def by_name(nodes):
+    return {n["name"]: n for n in nodes}
+
+
+def test_nested_tree(tmp_path):
+    inner = make_zip({"secret.txt": b"hello flag{nested_one} bye",
+                      "pic.png": b"\x89PNG\r\n\x1a\n" + b"x" * 100})
+    path = tmp_path / "outer.tar.gz"
+    make_tar_gz(path, {"inner.zip": inner, "note.xz": lzma.compress(b"picoCTF{xz_in_tar}")})
+
+    nodes = main.scan_archive(str(path))
+    assert [(n["name"], n["depth"], n["type"]) for n in nodes] == [
+        ("outer.tar.gz", 0, "gzip"), ("outer.tar", 1, "tar"), ("inner.zip", 2, "zip"),
+        ("secret.txt", 3, "text"), ("pic.png", 3, "png"), ("note.xz", 2, "xz"), ("note", 3, "text"),
+    ]
+    nodes = by_name(nodes)
+    assert nodes["secret.txt"]["flags"] == ["flag{nested_one}"]
+    assert nodes["note"]["flags"] == ["picoCTF{xz_in_tar}"]
+    assert nodes["outer.tar"]["csize"] == os.path.getsize(path)
+
+
+def test_streams_without_spooling(tmp_path, monkeypatch):
+    spools = []
+
+    class Recorder(tempfile.SpooledTemporaryFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            spools.append(self)
+
+    monkeypatch.setattr(tempfile, "SpooledTemporaryFile", Recorder)
+    path = tmp_path / "big.tar.gz"
+    make_tar_gz(path, {"big.txt": os.urandom(3 * 1024 * 1024)})
+    nodes = main.scan_archive(str(path), mem_budget=1024 * 1024)
+    assert spools == []
+    assert not any(n["spilled"] for n in nodes)
+    assert by_name(nodes)["big.txt"]["size"] == 3 * 1024 * 1024
+
+
+def test_nested_zip_spills_over_budget(tmp_path):
+    path = tmp_path / "outer.tar.gz"
+    make_tar_gz(path, {"inner.zip": make_zip({"rand.bin": os.urandom(2 * 1024 * 1024)})})
+    nodes = by_name(main.scan_archive(str(path), mem_budget=1024 * 1024))
+    assert nodes["inner.zip"]["spilled"]
+    assert nodes["rand.bin"]["size"] == 2 * 1024 * 1024
+
+
+def test_compressible_member_is_reported_not_cut(tmp_path):
+    data = b"\0" * (20 * 1024 * 1024) + b"flag{after_zeros}"
+    path = tmp_path / "zeros.zip"
+    path.write_bytes(make_zip({"zeros.bin": data}))
+    node = by_name(main.scan_archive(str(path)))["zeros.bin"]
+    assert node["bomb"] and not node["truncated"]
+    assert node["size"] == len(data)
+    assert node["flags"] == ["flag{after_zeros}"]
+
+
+def test_member_limit_marks_lower_bound(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "ARCHIVE_MAX_MEMBER", 1024 * 1024)
+    path = tmp_path / "big.zip"
+    path.write_bytes(make_zip({"zeros.bin": b"\0" * (5 * 1024 * 1024)}))
+    node = by_name(main.scan_archive(str(path)))["zeros.bin"]
+    assert node["truncated"]
+    assert node["size"] == 5 * 1024 * 1024
+
+
+def test_nested_streams_charge_budget_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "ARCHIVE_MAX_TOTAL", 3 * 1024 * 1024)
+    path = tmp_path / "two.tar.gz"
+    make_tar_gz(path, {"a.bin": os.urandom(1024 * 1024), "b.bin": os.urandom(1024 * 1024)})
+    nodes = main.scan_archive(str(path))
+    assert not any(n["truncated"] or n["error"] for n in nodes)
+
+
+def test_parent_limit_truncates_member(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "ARCHIVE_MAX_MEMBER", 1024 * 1024)
+    path = tmp_path / "cut.tar.gz"
+    make_tar_gz(path, {"a.bin": os.urandom(700 * 1024), "b.bin": os.urandom(700 * 1024)})
+    nodes = by_name(main.scan_archive(str(path)))
+    assert nodes["cut.tar"]["truncated"]
+    assert not nodes["a.bin"]["truncated"]
+    assert nodes["b.bin"]["truncated"]
+
+
+def test_small_compressible_member_is_not_a_bomb(tmp_path):
+    path = tmp_path / "sparse.zip"
+    path.write_bytes(make_zip({"zeros.bin": b"\0" * (1024 * 1024)}))
+    node = by_name(main.scan_archive(str(path)))["zeros.bin"]
+    assert node["ratio"] >= main.ARCHIVE_BOMB_RATIO and not node["bomb"]
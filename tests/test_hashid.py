@@ -0,0 +1,75 @@
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("line, mode", [
+    ("8743b52063cd84097a65d1633f5c74f5", 0),
+    ("b89eaac7e61417341b710b727768294d0e6a277b", 100),
+    ("127e6fbfe24a750e72930c220a8e138275656b8e5d8f48a98c3c92df2caba935", 1400),
+    ("*2470C0C06DEE42FD1618BB99005ADCA2EC9D1E19", 300),
+    ("$1$28772684$iEwNOgGugqO9.bIz5sk8k/", 500),
+    ("$apr1$71850310$gh9m4xcAn3MGxogwX/ztb.", 1600),
+    ("$2a$05$LhayLxezLhK1LhWvKxCyLOj0j1u.Kj0jZ0pEmm134uzrQlFvQJLF6", 3200),
+    ("$5$rounds=5000$GX7BopJZJxPc/KEK$le16UF8I2Anb.rOrn22AUPWvzUETDGefUmAV8AZkGcD", 7400),
+    ("$6$72820166$U4DVzpcYxgw7MVVDGGvB2/H5lRistD5.Ah4upwENR5UtffLR4X4SxSzfREv8z6wVl0jRFX40/KnYVvK4829kD1", 1800),
+    ("$P$984478476IagS59wHZvyQMArzfx58u.", 400),
+    ("$argon2id$v=19$m=65536,t=3,p=1$FBMjI4RJBhIykCgol1KEJA$2ky5GAdhT1kH4kIgPN/oERE3Taiy43vNN3BeIbTr6Qk", 34000),
+    ("0x010018102152f8f28c8499d8ef263c53f8be369d799f931b2fbe", 132),
+    ("{SHA}uJ6qx+YUFzQbcQtyd2gpTQ5qJ3s=", 101),
+    ("pbkdf2_sha256$10000$1135411628$bFYX62rfJobJ07VwrUMXfuffLfj2RDM2G6/BrTrUWkE=", 10000),
+    ("admin:500:aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0:::", 1000),
+    ("48c/R8JAv757A", 1500),
+])
+def test_identify(line, mode):
+    candidates, _ = main.identify_hash(line)
+    assert candidates[0][1] == mode
+
+
+@pytest.mark.parametrize("line", [
+    "$6$salt$abc",
+    "0x0100AABB",
+    "$2y$10$tooshort",
+    "passwordtest1",
+    "not a hash at all",
+    "",
+])
+def test_rejects_malformed(line):
+    assert main.identify_hash(line)[0] is None
+
+
+def test_pwdump_yields_nt_hash():
+    line = "admin:500:aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0:::"
+    assert main.identify_hash(line)[1] == "31d6cfe0d16ae931b73c59d7e0c089c0"
+
+
+def test_groups_by_mode(tmp_path):
+    salt = "$v=19$m=65536,t=3,p=1$FBMjI4RJBhIykCgol1KEJA$2ky5GAdhT1kH4kIgPN/oERE3Taiy43vNN3BeIbTr6Qk"
+    path = tmp_path / "dump.txt"
+    path.write_text("\n".join([
+        "$argon2id" + salt, "$argon2i" + salt, "$argon2d" + salt,
+        "8743b52063cd84097a65d1633f5c74f5", "8743b52063cd84097a65d1633f5c74f6",
+        "# comment", "", "garbage!",
+    ]) + "\n")
+
+    res = main.identify_hash_file(str(path), str(tmp_path))
+    assert (res["total"], res["unknown"]) == (6, 1)
+    assert res["groups"][34000]["names"] == ["Argon2id", "Argon2i", "Argon2d"]
+    assert res["groups"][34000]["count"] == 3
+    assert len((tmp_path / "dump.m34000.txt").read_text().splitlines()) == 3
+    assert len((tmp_path / "dump.m0.txt").read_text().splitlines()) == 2
+
+
+def test_split_keeps_raw_salt_bytes(tmp_path):
+    line = b"8743b52063cd84097a65d1633f5c74f5:s\xe9l\xff"
+    path = tmp_path / "salted.txt"
+    path.write_bytes(line + b"\n")
+    res = main.identify_hash_file(str(path), str(tmp_path))
+    assert (tmp_path / "salted.m10.txt").read_bytes() == line + b"\n"
+    assert not res["groups"][10]["extracted"]
+
+
+def test_pwdump_group_is_marked_extracted(tmp_path):
+    path = tmp_path / "pwdump.txt"
+    path.write_text("admin:500:aad3b435b51404eeaad3b435b51404ee:31d6cfe0d16ae931b73c59d7e0c089c0:::\n")
+    assert main.identify_hash_file(str(path))["groups"][1000]["extracted"]
@@ -0,0 +1,88 @@
+import os
+import shutil
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def bindir(tmp_path, monkeypatch):
+    path = tmp_path / "bin"
+    path.mkdir()
+    for name in ("zsteg", "binwalk"):
+        exe = path / name
+        exe.write_text("#!/bin/sh\n")
+        exe.chmod(0o755)
+        os.utime(exe, (1000, 1000))
+    os.utime(path, (1000, 1000))
+    monkeypatch.setenv("PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def which_calls(monkeypatch):
+    calls = []
+    real = shutil.which
+
+    def which(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return real(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(main.shutil, "which", which)
+    return calls
+
+
+TOOLS = {"zsteg": "zsteg", "binwalk": "binwalk", "stegseek": "stegseek"}
+
+
+def probe(tmp_path, tools=TOOLS):
+    return main.probe_tools(tools, cache_file=str(tmp_path / "cache" / "tools.json"))
+
+
+def test_cache_hit(tmp_path, bindir, which_calls):
+    results, used_cache = probe(tmp_path)
+    assert not used_cache
+    assert results == {"zsteg": str(bindir / "zsteg"), "binwalk": str(bindir / "binwalk"), "stegseek": None}
+
+    del which_calls[:]
+    assert probe(tmp_path) == (results, True)
+    assert which_calls == []
+
+
+def test_path_change_rescans(tmp_path, bindir, which_calls, monkeypatch):
+    probe(tmp_path)
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setenv("PATH", os.pathsep.join([str(other), str(bindir)]))
+    del which_calls[:]
+    assert not probe(tmp_path)[1]
+    assert sorted(which_calls) == sorted(TOOLS.values())
+
+
+def test_path_dir_mtime_finds_new_tool(tmp_path, bindir, which_calls):
+    assert probe(tmp_path)[0]["stegseek"] is None
+    exe = bindir / "stegseek"
+    exe.write_text("#!/bin/sh\n")
+    exe.chmod(0o755)
+    os.utime(bindir, (2000, 2000))
+    results, used_cache = probe(tmp_path)
+    assert not used_cache
+    assert results["stegseek"] == str(exe)
+
+
+def test_binary_mtime_revalidates_only_that_tool(tmp_path, bindir, which_calls):
+    probe(tmp_path)
+    os.utime(bindir / "zsteg", (2000, 2000))
+    del which_calls[:]
+    assert not probe(tmp_path)[1]
+    assert which_calls == ["zsteg"]
+
+
+def test_changed_cmd_revalidates(tmp_path, bindir, which_calls):
+    probe(tmp_path)
+    del which_calls[:]
+    results, used_cache = probe(tmp_path, dict(TOOLS, zsteg="binwalk"))
+    assert not used_cache
+    assert which_calls == ["binwalk"]
+    assert results["zsteg"] == str(bindir / "binwalk")
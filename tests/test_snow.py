@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+import main
+
+
+def snow_encode(message, password=None, huffcodes=None):
+    """Minimal SNOW encoder (message -> optional compress -> optional ICE -> whitespace)"""
+    bits = []
+    for c in message:
+        if huffcodes:
+            bits += [int(b) for b in huffcodes[c]]
+        else:
+            bits += [(c >> (7 - i)) & 1 for i in range(8)]
+    if password:
+        key, iv = main.snow_ice_key(password)
+        iv = int.from_bytes(iv, "big")
+        out = []
+        for bit in bits:
+            c = bit ^ (key.encrypt(iv.to_bytes(8, "big"))[0] >> 7)
+            out.append(c)
+            iv = ((iv << 1) & 0xffffffffffffffff) | c
+        bits = out
+    while len(bits) % 3:
+        bits.append(0)
+
+    lines, ws = [], "\t"
+    for i in range(0, len(bits), 3):
+        ws += " " * (bits[i] * 4 + bits[i + 1] * 2 + bits[i + 2]) + "\t"
+        if len(ws) > 40:
+            lines.append("some cover text" + ws)
+            ws = ""
+    if ws:
+        lines.append("some cover text" + ws)
+    return "\n".join(lines + ["last line"]) + "\n"
+
+
+@pytest.mark.parametrize("level, key, ciphertext", [
+    (0, "deadbeef01234567", "de240d83a00a9cc0"),
+    (1, "deadbeef01234567", "7d6ef1ef30d47a96"),
+    (2, "00112233445566778899aabbccddeeff", "f94840d86972f21c"),
+])
+def test_ice_vectors(level, key, ciphertext):
+    ice = main.IceKey(level, bytes.fromhex(key))
+    assert ice.encrypt(bytes.fromhex("fedcba9876543210")).hex() == ciphertext
+
+
+def test_round_trip_plain(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_text(snow_encode(b"flag{plain}"))
+    res = main.snow_scan_file(str(path))
+    assert res["found"]
+    assert res["candidates"][0]["data"] == b"flag{plain}"
+
+
+@pytest.mark.parametrize("password", ["hunter2", "correct horse battery staple", "pässwörd"])
+def test_round_trip_password(tmp_path, password):
+    path = tmp_path / "secret.txt"
+    path.write_text(snow_encode(b"flag{secret}", password))
+    res = main.snow_scan_file(str(path), ["wrong", password])
+    best = res["candidates"][0]
+    assert (best["password"], best["data"]) == (password, b"flag{secret}")
+
+
+def test_long_passphrase_is_capped():
+    # SNOW stops packing at 8184 bits, i.e. after 1170 characters
+    assert main.snow_ice_key("x" * 2000)[1] == main.snow_ice_key("x" * 1170)[1]
+    assert main.snow_ice_key("x" * 1170)[1] != main.snow_ice_key("x" * 1169)[1]
+
+
+def test_round_trip_compressed(tmp_path, monkeypatch):
+    # Any prefix-free table exercises the decoder; the real one comes from SNOW's huffcode.h
+    table = {byte: "1" * (byte % 4) + "0" + format(byte, "08b") for byte in range(256)}
+    monkeypatch.setattr(main, "_snow_huffcodes", {code: byte for byte, code in table.items()})
+    path = tmp_path / "packed.txt"
+    path.write_text(snow_encode(b"flag{packed}", huffcodes=table))
+    best = main.snow_scan_file(str(path))["candidates"][0]
+    assert (best["variant"], best["data"]) == ("compressed", b"flag{packed}")
+
+
+def test_no_whitespace_message(tmp_path):
+    path = tmp_path / "clean.txt"
+    path.write_text("trailing spaces only   \nnothing else\n")
+    assert not main.snow_scan_file(str(path))["found"]
+
+
+def test_decrypt_stops_on_flag():
+    stop = threading.Event()
+    stop.set()
+    assert main.snow_decrypt_bits(bytearray(1024), "pw", stop) is None
+
+
+def test_scan_files_in_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "SNOW_POOL_MIN_TRIALS", 0)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.txt"
+        path.write_text(snow_encode(f"flag{{file{i}}}".encode(), "pw"))
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.txt"))
+
+    results = {r["file"]: r for r in main.snow_scan_files(paths, ["pw"], workers=2)}
+    assert results[paths[3]]["error"]
+    for i in range(3):
+        assert results[paths[i]]["candidates"][0]["data"] == f"flag{{file{i}}}".encode()
+
+
+def test_scan_files_without_passwords(tmp_path):
+    path = tmp_path / "plain.txt"
+    path.write_text(snow_encode(b"flag{plain}"))
+    results = list(main.snow_scan_files([str(path)] * 2, workers=4))
+    assert [r["candidates"][0]["data"] for r in results] == [b"flag{plain}"] * 2